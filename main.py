@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import os
 import socket
-from datetime import datetime
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
 
-from typing import Dict, List
+from typing import Any, DefaultDict, Dict, List, Set, Type, Union, get_args
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from fastapi import Query, Path
 from typing import Optional
+from pydantic import BaseModel, TypeAdapter
 
 from models.person import PersonCreate, PersonRead, PersonUpdate, UNIType
 from models.address import AddressCreate, AddressRead, AddressUpdate
@@ -19,6 +25,12 @@ from models.house import HouseRead, HouseCreate, HouseUpdate
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+# Resolved once; the host's address does not change while the process runs
+try:
+    SERVER_IP = socket.gethostbyname(socket.gethostname())
+except socket.gaierror:
+    SERVER_IP = "127.0.0.1"
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
@@ -27,32 +39,170 @@ addresses: Dict[UUID, AddressRead] = {}
 organizations: Dict[UUID, OrganizationRead] = {}
 houses: Dict[UUID, HouseRead] = {}
 
+# Stored records are already validated, so responses are encoded straight to
+# JSON by pydantic-core instead of going through FastAPI's response_model pass
+address_list_adapter = TypeAdapter(List[AddressRead])
+person_list_adapter = TypeAdapter(List[PersonRead])
+organization_list_adapter = TypeAdapter(List[OrganizationRead])
+house_list_adapter = TypeAdapter(List[HouseRead])
+
+def json_response(content: Union[str, bytes], status_code: int = 200) -> Response:
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+# -----------------------------------------------------------------------------
+# Secondary indexes: filter field -> field value -> IDs of matching records
+# -----------------------------------------------------------------------------
+Index = Dict[str, DefaultDict[Any, Set[UUID]]]
+
+def make_index(*fields: str) -> Index:
+    return {field: defaultdict(set) for field in fields}
+
+address_index = make_index("street", "city", "state", "postal_code", "country")
+person_index = make_index("uni", "first_name", "last_name", "email", "phone", "birth_date", "city", "country")
+organization_index = make_index("org_name", "email", "phone", "city", "country")
+house_index = make_index("phone", "person_uni", "city", "country")
+
+# One lock per store guards the store, its index and its order map; handlers
+# run in FastAPI's threadpool, so read-modify-write sequences must not interleave
+address_lock = threading.Lock()
+person_lock = threading.Lock()
+organization_lock = threading.Lock()
+house_lock = threading.Lock()
+
+# Insertion position of each record, so filtered lists keep the store's order
+address_order: Dict[UUID, int] = {}
+person_order: Dict[UUID, int] = {}
+organization_order: Dict[UUID, int] = {}
+house_order: Dict[UUID, int] = {}
+
+def address_keys(address: AddressRead) -> Dict[str, Set[Any]]:
+    return {
+        "street": {address.street},
+        "city": {address.city},
+        "state": {address.state},
+        "postal_code": {address.postal_code},
+        "country": {address.country},
+    }
+
+def person_keys(person: PersonRead) -> Dict[str, Set[Any]]:
+    return {
+        "uni": {person.uni},
+        "first_name": {person.first_name},
+        "last_name": {person.last_name},
+        "email": {person.email},
+        "phone": {person.phone},
+        "birth_date": {str(person.birth_date)},
+        "city": {addr.city for addr in person.addresses},
+        "country": {addr.country for addr in person.addresses},
+    }
+
+def organization_keys(organization: OrganizationRead) -> Dict[str, Set[Any]]:
+    return {
+        "org_name": {organization.org_name},
+        "email": {organization.email},
+        "phone": {organization.phone},
+        "city": {organization.address.city},
+        "country": {organization.address.country},
+    }
+
+def house_keys(house: HouseRead) -> Dict[str, Set[Any]]:
+    return {
+        "phone": {house.phone},
+        "person_uni": set(house.people),
+        "city": {house.address.city},
+        "country": {house.address.country},
+    }
+
+def reindex(index: Index, record_id: UUID, old_keys: Dict[str, Set[Any]], new_keys: Dict[str, Set[Any]]):
+    # Only touch the buckets whose value actually changed
+    for field, new_values in new_keys.items():
+        old_values = old_keys.get(field, set())
+        buckets = index[field]
+        for value in old_values - new_values:
+            buckets[value].discard(record_id)
+            if not buckets[value]:
+                del buckets[value]
+        for value in new_values - old_values:
+            buckets[value].add(record_id)
+
+def patch_fields(update: BaseModel, model: Type[BaseModel]) -> Dict[str, Any]:
+    # Only the fields the client sent; nested models stay as validated instances
+    changes = {field: getattr(update, field) for field in update.model_fields_set}
+    # Update models accept null for every field, but model_copy does not
+    # re-validate, so reject nulls the stored model's field cannot hold
+    nulled = [
+        field for field, value in changes.items()
+        if value is None and type(None) not in get_args(model.model_fields[field].annotation)
+    ]
+    if nulled:
+        raise HTTPException(
+            status_code=422,
+            detail=[
+                {"type": "none_forbidden", "loc": ["body", field], "msg": "Field cannot be null", "input": None}
+                for field in nulled
+            ],
+        )
+    return changes
+
+def lookup(
+    index: Index, store: Dict[UUID, Any], order: Dict[UUID, int], lock: threading.Lock, **filters: Any
+) -> List[Any]:
+    # Held while walking the live buckets so concurrent writers cannot resize them
+    with lock:
+        if all(value is None for value in filters.values()):
+            return list(store.values())
+        id_sets = sorted(
+            (index[field].get(value, set()) for field, value in filters.items() if value is not None),
+            key=len,
+        )
+        # Single pass over the most selective filter, probing the others
+        smallest, others = id_sets[0], id_sets[1:]
+        hits = [record_id for record_id in smallest if all(record_id in ids for ids in others)]
+        hits.sort(key=order.__getitem__)
+        return [store[record_id] for record_id in hits]
+
 app = FastAPI(
     title="Person/Address/Organization/House API",
     description="Demo FastAPI app using Pydantic v2 models for Person, Address, Organization, and House",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
-def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
-    return Health(
-        status=200,
-        status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
-        echo=echo,
-        path_echo=path_echo
+# (monotonic time, formatted UTC timestamp) of the last health response;
+# bursts of health checks within a millisecond reuse the same string
+_timestamp_cache = (float("-inf"), "")
+
+def now_iso() -> str:
+    global _timestamp_cache
+    now = time.monotonic()
+    if now - _timestamp_cache[0] > 0.001:
+        _timestamp_cache = (now, datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"))
+    return _timestamp_cache[1]
+
+# Constant part of the Health payload, encoded once without its closing brace
+HEALTH_PREFIX = orjson.dumps({"status": 200, "status_message": "OK", "ip_address": SERVER_IP})[:-1]
+
+def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Response:
+    # Health-shaped JSON; Health stays the documented schema
+    body = (
+        HEALTH_PREFIX
+        + b',"timestamp":"' + now_iso().encode()
+        + b'","echo":' + orjson.dumps(echo)
+        + b',"path_echo":' + orjson.dumps(path_echo)
+        + b"}"
     )
+    return json_response(body)
 
-@app.get("/health", response_model=Health)
+@app.get("/health", responses={200: {"model": Health}})
 def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
     # Works because path_echo is optional in the model
     return make_health(echo=echo, path_echo=None)
 
-@app.get("/health/{path_echo}", response_model=Health)
+@app.get("/health/{path_echo}", responses={200: {"model": Health}})
 def get_health_with_path(
     path_echo: str = Path(..., description="Required echo in the URL path"),
     echo: str | None = Query(None, description="Optional echo string"),
@@ -61,10 +211,17 @@ def get_health_with_path(
 
 @app.post("/addresses", response_model=AddressRead, status_code=201)
 def create_address(address: AddressCreate):
-    if address.id in addresses:
-        raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
+    with address_lock:
+        if address.id in addresses:
+            raise HTTPException(status_code=400, detail="Address with this ID already exists")
+        # The payload is already validated; the Read model only adds server timestamps
+        now = datetime.utcnow()
+        address_read = AddressRead.model_construct(**address.__dict__, created_at=now, updated_at=now)
+        new_keys = address_keys(address_read)
+        addresses[address_read.id] = address_read
+        address_order[address_read.id] = len(address_order)
+        reindex(address_index, address_read.id, {}, new_keys)
+    return json_response(address_read.model_dump_json(), status_code=201)
 
 @app.get("/addresses", response_model=List[AddressRead])
 def list_addresses(
@@ -74,36 +231,39 @@ def list_addresses(
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
     country: Optional[str] = Query(None, description="Filter by country"),
 ):
-    results = list(addresses.values())
-
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
+    results = lookup(
+        address_index,
+        addresses,
+        address_order,
+        address_lock,
+        street=street,
+        city=city,
+        state=state,
+        postal_code=postal_code,
+        country=country,
+    )
+    return json_response(address_list_adapter.dump_json(results))
 
 @app.get("/addresses/{address_id}", response_model=AddressRead)
 def get_address(address_id: UUID):
     if address_id not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return json_response(addresses[address_id].model_dump_json())
 
 @app.patch("/addresses/{address_id}", response_model=AddressRead)
 def update_address(address_id: UUID, update: AddressUpdate):
-    if address_id not in addresses:
-        raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    addresses[address_id].updated_at = datetime.utcnow().isoformat()
-    return addresses[address_id]
+    with address_lock:
+        if address_id not in addresses:
+            raise HTTPException(status_code=404, detail="Address not found")
+        # Build the new record and its index keys before touching the store
+        old_keys = address_keys(addresses[address_id])
+        updated = addresses[address_id].model_copy(
+            update={**patch_fields(update, AddressRead), "updated_at": datetime.utcnow()}
+        )
+        new_keys = address_keys(updated)
+        addresses[address_id] = updated
+        reindex(address_index, address_id, old_keys, new_keys)
+    return json_response(updated.model_dump_json())
 
 # -----------------------------------------------------------------------------
 # Person endpoints
@@ -111,9 +271,14 @@ def update_address(address_id: UUID, update: AddressUpdate):
 @app.post("/persons", response_model=PersonRead, status_code=201)
 def create_person(person: PersonCreate):
     # Each person gets its own UUID; stored as PersonRead
-    person_read = PersonRead(**person.model_dump())
-    persons[person_read.id] = person_read
-    return person_read
+    with person_lock:
+        now = datetime.utcnow()
+        person_read = PersonRead.model_construct(**person.__dict__, created_at=now, updated_at=now)
+        new_keys = person_keys(person_read)
+        persons[person_read.id] = person_read
+        person_order[person_read.id] = len(person_order)
+        reindex(person_index, person_read.id, {}, new_keys)
+    return json_response(person_read.model_dump_json(), status_code=201)
 
 @app.get("/persons", response_model=List[PersonRead])
 def list_persons(
@@ -126,55 +291,59 @@ def list_persons(
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
 ):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
+    # city/country match if at least one nested address matches
+    results = lookup(
+        person_index,
+        persons,
+        person_order,
+        person_lock,
+        uni=uni,
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        phone=phone,
+        birth_date=birth_date,
+        city=city,
+        country=country,
+    )
+    return json_response(person_list_adapter.dump_json(results))
 
 @app.get("/persons/{person_id}", response_model=PersonRead)
 def get_person(person_id: UUID):
     if person_id not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return json_response(persons[person_id].model_dump_json())
 
 @app.patch("/persons/{person_id}", response_model=PersonRead)
 def update_person(person_id: UUID, update: PersonUpdate):
-    if person_id not in persons:
-        raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    persons[person_id].updated_at = datetime.utcnow().isoformat()
-    return persons[person_id]
+    with person_lock:
+        if person_id not in persons:
+            raise HTTPException(status_code=404, detail="Person not found")
+        # Build the new record and its index keys before touching the store
+        old_keys = person_keys(persons[person_id])
+        updated = persons[person_id].model_copy(
+            update={**patch_fields(update, PersonRead), "updated_at": datetime.utcnow()}
+        )
+        new_keys = person_keys(updated)
+        persons[person_id] = updated
+        reindex(person_index, person_id, old_keys, new_keys)
+    return json_response(updated.model_dump_json())
 
 # -----------------------------------------------------------------------------
 # Organization endpoints
 # -----------------------------------------------------------------------------
 @app.post("/organization", response_model=OrganizationRead, status_code=201)
 def create_organization(organization: OrganizationCreate):
-    if organization.id in organizations:
-        raise HTTPException(status_code=400, detail="Organization with this ID already exists")
-    organization_read = OrganizationRead(**organization.model_dump())
-    organizations[organization_read.id] = organization_read
-    return organization_read
+    with organization_lock:
+        if organization.id in organizations:
+            raise HTTPException(status_code=400, detail="Organization with this ID already exists")
+        now = datetime.utcnow()
+        organization_read = OrganizationRead.model_construct(**organization.__dict__, created_at=now, updated_at=now)
+        new_keys = organization_keys(organization_read)
+        organizations[organization_read.id] = organization_read
+        organization_order[organization_read.id] = len(organization_order)
+        reindex(organization_index, organization_read.id, {}, new_keys)
+    return json_response(organization_read.model_dump_json(), status_code=201)
 
 @app.get("/organizations", response_model=List[OrganizationRead])
 def list_organizations(
@@ -184,38 +353,39 @@ def list_organizations(
         city: Optional[str] = Query(None, description="Filter by city of address"),
         country: Optional[str] = Query(None, description="Filter by country of address"),
 ):
-    results = list(organizations.values())
-
-    if org_name is not None:
-        results = [p for p in results if p.org_name == org_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if p.address.city == city]
-    if country is not None:
-        results = [p for p in results if p.address.country == country]
-
-    return results
+    results = lookup(
+        organization_index,
+        organizations,
+        organization_order,
+        organization_lock,
+        org_name=org_name,
+        email=email,
+        phone=phone,
+        city=city,
+        country=country,
+    )
+    return json_response(organization_list_adapter.dump_json(results))
 
 @app.get("/organizations/{organization_id}", response_model=OrganizationRead)
 def get_organization(organization_id: UUID):
     if organization_id not in organizations:
         raise HTTPException(status_code=404, detail="Organization not found")
-    return organizations[organization_id]
+    return json_response(organizations[organization_id].model_dump_json())
 
 @app.patch("/organizations/{organization_id}", response_model=OrganizationRead)
 def update_organization(organization_id: UUID, update: OrganizationUpdate):
-    if organization_id not in organizations:
-        raise HTTPException(status_code=404, detail="Organization not found")
-    stored = organizations[organization_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    organizations[organization_id] = OrganizationRead(**stored)
-    organizations[organization_id].updated_at = datetime.utcnow().isoformat()
-    return organizations[organization_id]
+    with organization_lock:
+        if organization_id not in organizations:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        # Build the new record and its index keys before touching the store
+        old_keys = organization_keys(organizations[organization_id])
+        updated = organizations[organization_id].model_copy(
+            update={**patch_fields(update, OrganizationRead), "updated_at": datetime.utcnow()}
+        )
+        new_keys = organization_keys(updated)
+        organizations[organization_id] = updated
+        reindex(organization_index, organization_id, old_keys, new_keys)
+    return json_response(updated.model_dump_json())
 
 
 # -----------------------------------------------------------------------------
@@ -223,11 +393,16 @@ def update_organization(organization_id: UUID, update: OrganizationUpdate):
 # -----------------------------------------------------------------------------
 @app.post("/house", response_model=HouseRead, status_code=201)
 def create_house(house: HouseCreate):
-    if house.id in houses:
-        raise HTTPException(status_code=400, detail="House with this ID already exists")
-    house_read = HouseRead(**house.model_dump())
-    houses[house_read.id] = house_read
-    return house_read
+    with house_lock:
+        if house.id in houses:
+            raise HTTPException(status_code=400, detail="House with this ID already exists")
+        now = datetime.utcnow()
+        house_read = HouseRead.model_construct(**house.__dict__, created_at=now, updated_at=now)
+        new_keys = house_keys(house_read)
+        houses[house_read.id] = house_read
+        house_order[house_read.id] = len(house_order)
+        reindex(house_index, house_read.id, {}, new_keys)
+    return json_response(house_read.model_dump_json(), status_code=201)
 
 @app.get("/houses", response_model=List[HouseRead])
 def list_houses(
@@ -236,38 +411,38 @@ def list_houses(
         city: Optional[str] = Query(None, description="Filter by city of address"),
         country: Optional[str] = Query(None, description="Filter by country of address"),
 ):
-    results = list(houses.values())
-
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if p.address.city == city]
-    if country is not None:
-        results = [p for p in results if p.address.country == country]
-
-    # nested person filtering
-    if person_uni is not None:
-        results = [p for p in results if any(uni == person_uni for uni in p.people)]
-
-    return results
+    results = lookup(
+        house_index,
+        houses,
+        house_order,
+        house_lock,
+        phone=phone,
+        person_uni=person_uni,
+        city=city,
+        country=country,
+    )
+    return json_response(house_list_adapter.dump_json(results))
 
 @app.get("/houses/{house_id}", response_model=HouseRead)
 def get_house(house_id: UUID):
     if house_id not in houses:
         raise HTTPException(status_code=404, detail="House not found")
-    return houses[house_id]
+    return json_response(houses[house_id].model_dump_json())
 
 @app.patch("/houses/{house_id}", response_model=HouseRead)
 def update_house(house_id: UUID, update: HouseUpdate):
-    if house_id not in houses:
-        raise HTTPException(status_code=404, detail="House not found")
-    stored = houses[house_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    houses[house_id] = HouseRead(**stored)
-    houses[house_id].updated_at = datetime.utcnow().isoformat()
-    return houses[house_id]
+    with house_lock:
+        if house_id not in houses:
+            raise HTTPException(status_code=404, detail="House not found")
+        # Build the new record and its index keys before touching the store
+        old_keys = house_keys(houses[house_id])
+        updated = houses[house_id].model_copy(
+            update={**patch_fields(update, HouseRead), "updated_at": datetime.utcnow()}
+        )
+        new_keys = house_keys(updated)
+        houses[house_id] = updated
+        reindex(house_index, house_id, old_keys, new_keys)
+    return json_response(updated.model_dump_json())
 
 
 # -----------------------------------------------------------------------------
@@ -283,4 +458,17 @@ def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    # DEV_RELOAD=1 restores the auto-reloading development server
+    if os.environ.get("DEV_RELOAD") == "1":
+        uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    else:
+        # Single worker: the in-memory "databases" are per process
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=port,
+            loop="auto",  # uvloop when installed (not available on Windows)
+            http="httptools",
+            log_level="warning",
+            access_log=False,
+        )
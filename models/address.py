@@ -5,6 +5,25 @@ from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+# Address examples shared by the OpenAPI docs of the models embedding an address
+LONDON_ADDRESS_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "street": "123 Main St",
+    "city": "London",
+    "state": None,
+    "postal_code": "SW1A 1AA",
+    "country": "UK",
+}
+
+NEW_YORK_ADDRESS_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "street": "123 Main St",
+    "city": "New York",
+    "state": "NY",
+    "postal_code": "10025",
+    "country": "US",
+}
+
 
 class AddressBase(BaseModel):
     id: UUID = Field(
@@ -38,7 +57,10 @@ class AddressBase(BaseModel):
         json_schema_extra={"example": "USA"},
     )
 
+    # Validated once on the way in, then shared by reference between the
+    # request model and every stored Person/Organization/House embedding it
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -118,7 +140,10 @@ class AddressRead(AddressBase):
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    # Stored records are replaced via model_copy, never mutated in place
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -5,9 +5,25 @@ from uuid import UUID, uuid4
 from datetime import date, datetime
 from pydantic import BaseModel, Field
 
-from .address import AddressBase
+from .address import AddressBase, LONDON_ADDRESS_EXAMPLE, NEW_YORK_ADDRESS_EXAMPLE
 from .person import UNIType
 
+# Shared OpenAPI examples, built once and reused by every House variant
+_HOUSE_EXAMPLE = {
+    "id": "12345678-e29b-41d4-a716-123456781234",
+    "phone": "+1-212-555-0199",
+    "address": LONDON_ADDRESS_EXAMPLE,
+    "people": [
+        "abc1234",
+        "zde3421"
+    ]
+}
+
+_HOUSE_READ_EXAMPLE = {
+    **_HOUSE_EXAMPLE,
+    "created_at": "2025-01-15T10:20:30Z",
+    "updated_at": "2025-01-16T12:00:00Z"
+}
 
 
 class HouseBase(BaseModel):
@@ -26,18 +42,8 @@ class HouseBase(BaseModel):
     address: AddressBase = Field(
         ...,
         description="Address linked to this house (carries a persistent Address ID).",
-        json_schema_extra={
-            "example":
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "street": "123 Main St",
-                    "city": "London",
-                    "state": None,
-                    "postal_code": "SW1A 1AA",
-                    "country": "UK",
-                }
-        },
-    ),
+        json_schema_extra={"example": LONDON_ADDRESS_EXAMPLE},
+    )
     people: List[UNIType] = Field(
         default_factory=list,
         description="People living inside this house.",
@@ -49,54 +55,12 @@ class HouseBase(BaseModel):
         }
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "12345678-e29b-41d4-a716-123456781234",
-                    "phone": "+1-212-555-0199",
-                    "address": {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
-                        "street": "123 Main St",
-                        "city": "London",
-                        "state": None,
-                        "postal_code": "SW1A 1AA",
-                        "country": "UK",
-                    },
-                    "people": [
-                        "abc1234",
-                        "zde3421"
-                    ]
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_HOUSE_EXAMPLE]}}
 
 
 class HouseCreate(HouseBase):
     """Creation payload for a House."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "12345678-e29b-41d4-a716-123456781234",
-                    "phone": "+1-212-555-0199",
-                    "address": {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
-                        "street": "123 Main St",
-                        "city": "London",
-                        "state": None,
-                        "postal_code": "SW1A 1AA",
-                        "country": "UK",
-                    },
-                    "people": [
-                        "abc1234",
-                        "zde3421"
-                    ]
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_HOUSE_EXAMPLE]}}
 
 
 class HouseUpdate(BaseModel):
@@ -105,19 +69,9 @@ class HouseUpdate(BaseModel):
     address: Optional[AddressBase] = Field(
         None,
         description="Replace the old address with this new address.",
-        json_schema_extra={
-            "example":
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "street": "123 Main St",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10025",
-                    "country": "US",
-                }
-        }
+        json_schema_extra={"example": NEW_YORK_ADDRESS_EXAMPLE}
     )
-    people: Optional[List[UUID]] = Field(
+    people: Optional[List[UNIType]] = Field(
         None,
         description="Replace the entire set of people with this list.",
         json_schema_extra={
@@ -160,27 +114,9 @@ class HouseRead(HouseBase):
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    # Stored records are replaced via model_copy, never mutated in place
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "12345678-e29b-41d4-a716-123456781234",
-                    "phone": "+1-212-555-0199",
-                    "address": {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
-                        "street": "123 Main St",
-                        "city": "London",
-                        "state": None,
-                        "postal_code": "SW1A 1AA",
-                        "country": "UK",
-                    },
-                    "people": [
-                        "abc1234",
-                        "zde3421"
-                    ],
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z"
-                }
-            ]
-        }
+        "frozen": True,
+        "extra": "forbid",
+        "json_schema_extra": {"examples": [_HOUSE_READ_EXAMPLE]},
     }
@@ -5,7 +5,24 @@ from uuid import UUID, uuid4
 from datetime import date, datetime
 from pydantic import BaseModel, Field, EmailStr
 
-from .address import AddressBase
+from .address import AddressBase, LONDON_ADDRESS_EXAMPLE, NEW_YORK_ADDRESS_EXAMPLE
+
+# Shared OpenAPI examples, built once and reused by every Organization variant
+_ORG_EXAMPLE = {
+    "id": "12345678-e29b-41d4-a716-123456781234",
+    "org_name": "Computer Science",
+    "email": "columbia_cs@columbia.edu",
+    "phone": "+1-212-555-0199",
+    "address": LONDON_ADDRESS_EXAMPLE,
+}
+
+_ORG_CREATE_EXAMPLE = {**_ORG_EXAMPLE, "address": NEW_YORK_ADDRESS_EXAMPLE}
+
+_ORG_READ_EXAMPLE = {
+    **_ORG_EXAMPLE,
+    "created_at": "2025-01-15T10:20:30Z",
+    "updated_at": "2025-01-16T12:00:00Z"
+}
 
 
 class OrganizationBase(BaseModel):
@@ -34,63 +51,15 @@ class OrganizationBase(BaseModel):
     address: AddressBase = Field(
         ...,
         description="Address linked to this organization (carries a persistent Address ID).",
-        json_schema_extra={
-            "example":
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "street": "123 Main St",
-                    "city": "London",
-                    "state": None,
-                    "postal_code": "SW1A 1AA",
-                    "country": "UK",
-                }
-        },
+        json_schema_extra={"example": LONDON_ADDRESS_EXAMPLE},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "12345678-e29b-41d4-a716-123456781234",
-                    "org_name": "Computer Science",
-                    "email": "columbia_cs@columbia.edu",
-                    "phone": "+1-212-555-0199",
-                    "address": {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
-                        "street": "123 Main St",
-                        "city": "London",
-                        "state": None,
-                        "postal_code": "SW1A 1AA",
-                        "country": "UK",
-                    }
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_ORG_EXAMPLE]}}
 
 
 class OrganizationCreate(OrganizationBase):
     """Creation payload for an Organization."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "12345678-e29b-41d4-a716-123456781234",
-                    "org_name": "Computer Science",
-                    "email": "columbia_cs@columbia.edu",
-                    "phone": "+1-212-555-0199",
-                    "address": {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
-                        "street": "123 Main St",
-                        "city": "New York",
-                        "state": "NY",
-                        "postal_code": "10025",
-                        "country": "US",
-                    }
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_ORG_CREATE_EXAMPLE]}}
 
 
 class OrganizationUpdate(BaseModel):
@@ -101,17 +70,7 @@ class OrganizationUpdate(BaseModel):
     address: Optional[AddressBase] = Field(
         None,
         description="Replace the old address with this new address.",
-        json_schema_extra={
-            "example":
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "street": "123 Main St",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10025",
-                    "country": "US",
-                }
-        }
+        json_schema_extra={"example": NEW_YORK_ADDRESS_EXAMPLE}
     )
 
     model_config = {
@@ -148,25 +107,9 @@ class OrganizationRead(OrganizationBase):
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    # Stored records are replaced via model_copy, never mutated in place
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "12345678-e29b-41d4-a716-123456781234",
-                    "org_name": "Computer Science",
-                    "email": "columbia_cs@columbia.edu",
-                    "phone": "+1-212-555-0199",
-                    "address": {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
-                        "street": "123 Main St",
-                        "city": "London",
-                        "state": None,
-                        "postal_code": "SW1A 1AA",
-                        "country": "UK",
-                    },
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z"
-                }
-            ]
-        }
+        "frozen": True,
+        "extra": "forbid",
+        "json_schema_extra": {"examples": [_ORG_READ_EXAMPLE]},
     }
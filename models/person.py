@@ -182,7 +182,10 @@ class PersonRead(PersonBase):
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    # Stored records are replaced via model_copy, never mutated in place
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {